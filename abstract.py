@@ -23,6 +23,11 @@ class Drawable:
         For a triangle, it will be the length of a side
     """
 
+    # Drawable, Killable, and Moveable all have empty __slots__, and the 
+    # concrete classes declare the attributes, since a class can only inherit
+    # from one base with non-empty __slots__
+    __slots__ = ()
+
     def __init__(
             self, 
             x: int, 
@@ -52,20 +57,17 @@ class Drawable:
         collided : bool
             A bool denoting whether or not the collision occured
         """
-        # Classic linear distance function
-        # The root of the sum of the difference of the x's squared and y's squared 
-        dist = sum(
-                    [
-                        (self.x - other.x)**2, 
-                        (self.y - other.y)**2
-                    ]
-                )**0.5
+        # Classic linear distance function, compared squared so we don't
+        # need to take the root
+        d_x = self.x - other.x
+        d_y = self.y - other.y
+
         # The minimum acceptable non-collision distance
         min_dist = self.size + other.size + 10 # a small buffer
 
         # Whether or not the distance between the objects is less than the
         # minimum accepted distance
-        return dist <= min_dist
+        return d_x*d_x + d_y*d_y <= min_dist*min_dist
 
 class Moveable:
     """A class representing an objects ability to be moved
@@ -82,6 +84,8 @@ class Moveable:
         The object's velocity in the y direction
     """
 
+    __slots__ = ()
+
     def __init__(
             self, 
             v_x: int, 
@@ -111,6 +115,8 @@ class Killable:
         is killed after a single hit.
     """
 
+    __slots__ = ()
+
     def __init__(self, health: int) -> None:
         """Initializes the health to the provided health"""
         self.health = health
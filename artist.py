@@ -17,14 +17,14 @@ class Artist:
             y: int, 
             color: tuple, 
             size: int,
-            shape: str) -> None: 
+            shape: str) -> pygame.Rect: 
         """
         Draws the object based on its parameters
 
-        This function uses a dictionary to store shape: parameter, functions.
         The shape is one of 's', 't', or 'c' signifying square, triangle, or circle.
-        The parameters is a tuple of the parameters that are to be passed to the
-        respective pygame.draw function.
+        This function looks up the draw function for the shape with 
+        shape_drawer on every call, so objects that are drawn every frame 
+        should keep the result of shape_drawer instead.
 
         Parameters
         ----------
@@ -44,23 +44,95 @@ class Artist:
         shape : str
             A string of characters 's', 't', or 'c' denoting whether the object is a
             square, triangle, or circle.
+
+        Returns
+        -------
+        rect : pygame.Rect
+            The area of the surface that was drawn over
+        """
+        # Choose which function to use depending on the first character of 
+        # the passed string
+        return Artist.shape_drawer(shape)(surface, x, y, color, size)
+
+    @staticmethod
+    def shape_drawer(shape: str):
+        """
+        Returns the draw function for the given shape
+
+        Parameters
+        ----------
+        shape : str
+            A string of characters 's', 't', or 'c' denoting whether the object is a
+            square, triangle, or circle.
+
+        Returns
+        -------
+        draw_fn : function
+            One of draw_square, draw_triangle, or draw_circle
+        """
+        return {
+            's': Artist.draw_square,
+            't': Artist.draw_triangle,
+            'c': Artist.draw_circle,
+        }[shape[0]]
+
+    @staticmethod
+    def draw_square(
+            surface: pygame.Surface, 
+            x: int, 
+            y: int, 
+            color: tuple, 
+            size: int) -> pygame.Rect:
+        """
+        Draws a square based on its parameters. Refer to `draw`
+
+        Returns
+        -------
+        rect : pygame.Rect
+            The area of the surface that was drawn over
+        """
+        # Rectangle draw takes coords and side lengths
+        return pygame.draw.rect(surface, color, (x, y, size, size))
+
+    @staticmethod
+    def draw_triangle(
+            surface: pygame.Surface, 
+            x: int, 
+            y: int, 
+            color: tuple, 
+            size: int) -> pygame.Rect:
+        """
+        Draws a triangle based on its parameters. Refer to `draw`
+
+        Returns
+        -------
+        rect : pygame.Rect
+            The area of the surface that was drawn over
+        """
+        # Polygon draw takes the coords of the points of the triangle
+        return pygame.draw.polygon(surface, color, (
+            (x, y), 
+            (x - size//2, y + size//2),
+            (x + size//2, y + size//2)
+        ))
+
+    @staticmethod
+    def draw_circle(
+            surface: pygame.Surface, 
+            x: int, 
+            y: int, 
+            color: tuple, 
+            size: int) -> pygame.Rect:
         """
-        *shape_to_draw, function_to_use = {
-            # Rectangle draw takes coords and side lengths
-            's': ((x, y, size, size), pygame.draw.rect),
-            # Polygon draw takes 2 coords of the points of the triangle
-            't':  ((
-                    (x, y), 
-                    (x - size//2, y + size//2),
-                    (x + size//2, y + size//2)
-                ), pygame.draw.polygon),
-            # Circle draw takes a tuple of coords and a radius
-            'c': ((x, y), size/2, pygame.draw.circle),
-        }[shape[0]] # Choose which shape to draw and function to use depending on the
-        # first character of the passed string
-
-        # Run the given function with the given parameters
-        function_to_use(surface, color, *shape_to_draw)
+        Draws a circle based on its parameters. Refer to `draw`
+
+        Returns
+        -------
+        rect : pygame.Rect
+            The area of the surface that was drawn over
+        """
+        # Circle draw takes a tuple of coords and a radius
+        return pygame.draw.circle(surface, color, (x, y), size/2)
     
     @staticmethod
     def draw_cannon(
@@ -69,7 +141,7 @@ class Artist:
             y: int, 
             angle: int, 
             pow: int, 
-            color: tuple) -> None:
+            color: tuple) -> pygame.Rect:
         """
         Draws the cannon based on its parameters
 
@@ -90,6 +162,11 @@ class Artist:
             The power of the cannon (depending on how long the user held for)
         color : tuple
             A tuple representing the (R, G, B) values of the object's color
+
+        Returns
+        -------
+        rect : pygame.Rect
+            The area of the surface that was drawn over
         """
 
         vec_1 = np.array(
@@ -124,11 +201,11 @@ class Artist:
             (gun_pos - vec_1).tolist()
         )
         
-        pygame.draw.polygon(surface, color, gun_shape)
+        return pygame.draw.polygon(surface, color, gun_shape)
 
     @staticmethod
-    def draw_score(
-            surface: pygame.Surface, 
+    def render_score(
+            surface_size: tuple, 
             font: pygame.font.Font, 
             targets_destroyed: int, 
             projectiles_used: int, 
@@ -136,16 +213,19 @@ class Artist:
             chosen_type: str,
             health: int,
             primary_color: tuple, 
-            secondary_color: tuple) -> None:
+            secondary_color: tuple) -> list[tuple]:
         """
-        Draws the score table based on its parameters
+        Renders the score table based on its parameters, without drawing it
 
-        This function uses the font, scores, and colors to draw the score table
+        This function uses the font, scores, and colors to render the text of
+        the score table, and determines where each piece of text goes. Since
+        rendering text is slow, the result can be kept and drawn with
+        draw_rendered for as long as the score doesn't change
 
         Parameters
         ----------
-        surface : pygame.Surface
-            The surface to draw the cannon onto
+        surface_size : tuple
+            The (X, Y) size of the surface the score table will be drawn onto
         font : pygame.font
             The font to use for the text
         targets_destroyed : int
@@ -163,6 +243,11 @@ class Artist:
             The color to use for the statistics
         secondary_color : tuple
             The color to use for the statistics
+
+        Returns
+        -------
+        rendered : list[tuple]
+            A list of (text surface, position) pairs for each piece of text
         """
         score_surf = []
         
@@ -218,15 +303,40 @@ class Artist:
             )
         )
 
-        # Place each text piece to the screen
+        # Where to place each text piece on the screen
+        rendered = []
         for i in range(3):
-            surface.blit(
+            rendered.append((
                 score_surf[i], 
                 [10, 10 + 30*i]\
-            )
+            ))
         
-        surface.blit(score_surf[-2], [surface.get_size()[1] - 50, 10])
-        surface.blit(score_surf[-1], [surface.get_size()[1] - 50, 40])
+        rendered.append((score_surf[-2], [surface_size[1] - 50, 10]))
+        rendered.append((score_surf[-1], [surface_size[1] - 50, 40]))
+
+        return rendered
+
+    @staticmethod
+    def draw_rendered(
+            surface: pygame.Surface, 
+            rendered: list[tuple]) -> list[pygame.Rect]:
+        """
+        Draws pre-rendered pieces of text (or any surfaces) onto the surface
+
+        Parameters
+        ----------
+        surface : pygame.Surface
+            The surface to draw the pieces onto
+        rendered : list[tuple]
+            A list of (surface, position) pairs, like the one returned by 
+            render_score
+
+        Returns
+        -------
+        rects : list[pygame.Rect]
+            The areas of the surface that were drawn over
+        """
+        return [surface.blit(piece, position) for piece, position in rendered]
     
     @staticmethod
     def draw_death_screen(
@@ -1,13 +1,13 @@
 from abstract import Drawable, Killable, Moveable
 from artist import Artist
-from pygame import Surface
+from pygame import Surface, Rect
 from color import Color
 
 import random
 
 class BombMaster:
     """
-    Implements methods for target-wide bomb checking
+    Implements methods for game-wide bomb checking
 
     Introduces methods for creating bombs and maintaining existing 
     bombs (drawing them and moving them)
@@ -15,7 +15,7 @@ class BombMaster:
     Attributes
     ----------
     bomb_list : list[Bomb]
-        A list of all the bombs created by this BombMaster
+        A list of all the bombs created by this BombMaster (for every target)
     """
 
     def __init__(self) -> None:
@@ -60,7 +60,7 @@ class BombMaster:
         created_bomb = Bomb(**params)
         self.bomb_list.append(created_bomb)
 
-    def draw_all(self, surface: Surface) -> None:
+    def draw_all(self, surface: Surface) -> list[Rect]:
         """
         Simply loops through all the bombs and draws them to the surface
         
@@ -70,8 +70,13 @@ class BombMaster:
         ----------
         surface : pygame.Surface
             The surface to draw the bomb to
+
+        Returns
+        -------
+        rects : list[pygame.Rect]
+            The areas of the surface that were drawn over
         """
-        [bomb.draw(surface) for bomb in self.bomb_list]
+        return [bomb.draw(surface) for bomb in self.bomb_list]
 
     def move_all(self) -> None:
         """
@@ -79,11 +84,16 @@ class BombMaster:
           
         Moves them by calling bomb.move function on each bomb
         """
-        [bomb.move(gravity=2) for bomb in self.bomb_list]
+        for bomb in self.bomb_list:
+            bomb.move(gravity=2)
 
     def remove_exploded(self, screen_y: int, user: Drawable) -> None:
         """
         Removes the dead bombs from the list
+
+        Walks the list from the back, replacing each dead bomb with the last
+        one in the list, so nothing has to be shifted down (the order of the
+        bombs isn't kept)
         
         Parameters
         ----------
@@ -92,10 +102,16 @@ class BombMaster:
         user : Drawable
             A Drawable object that is the user
         """
-        for bomb in self.bomb_list:
+        bomb_list = self.bomb_list
+
+        for i in range(len(bomb_list) - 1, -1, -1):
+            bomb = bomb_list[i]
             bomb.check_explode(screen_y, user)
+
             if not bomb.is_alive:
-                self.bomb_list.remove(bomb)
+                last = bomb_list.pop()
+                if i < len(bomb_list):
+                    bomb_list[i] = last
     
 class Bomb(Drawable, Killable, Moveable):
     """
@@ -130,8 +146,15 @@ class Bomb(Drawable, Killable, Moveable):
     shape : str
         A string of characters 's', 't', or 'c' denoting whether the object is a
         square, triangle, or circle (default 'c')
+    draw_fn : function
+        The Artist draw function for the object's shape, chosen once when the
+        object is created
     """
 
+    __slots__ = (
+        'x', 'y', 'color', 'size', 'health', 'v_x', 'v_y', 'shape', 'draw_fn'
+    )
+
     def __init__(
             self, 
             x: int, 
@@ -150,6 +173,7 @@ class Bomb(Drawable, Killable, Moveable):
         Moveable.__init__(self, v_x = 0, v_y = v_y)
         # Shape initialization
         self.shape = shape
+        self.draw_fn = Artist.shape_drawer(shape)
     
     def move(self, time: int = 1, gravity: int = 0) -> None:
         """
@@ -168,20 +192,21 @@ class Bomb(Drawable, Killable, Moveable):
         # Change y-position based on time
         self.y += time * self.v_y
 
-    def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> Rect:
         """
-        Draws the bomb by delgating to the default Artist.draw function
+        Draws the bomb by delgating to the Artist draw function for its shape
 
         Parameters
         ----------
         surface : pygame.Surface
             The surface to draw the bomb onto
+
+        Returns
+        -------
+        rect : pygame.Rect
+            The area of the surface that was drawn over
         """
-        Artist.draw(
-            surface,
-            self.x, self.y,
-            self.color, self.size, self.shape
-        )
+        return self.draw_fn(surface, self.x, self.y, self.color, self.size)
     
     def check_bottom(self, screen_y: int) -> bool:
         """
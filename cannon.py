@@ -6,7 +6,7 @@ from artist import Artist
 from projectiles import ProjectileMaster
 from targets import TargetMaster
 
-from pygame import Surface
+from pygame import Surface, Rect
 import random
 import time
 import threading
@@ -154,7 +154,7 @@ class Cannon(Drawable, Killable):
                                 target_x - self.x
                             )
 
-    def draw(self, surface: Surface):
+    def draw(self, surface: Surface) -> Rect:
         """
         Draws the cannon by delegating to the Artist draw_cannon method
 
@@ -162,8 +162,13 @@ class Cannon(Drawable, Killable):
         ----------
         surface : pygame.Surface:
             The surface to draw the cannon onto
+
+        Returns
+        -------
+        rect : pygame.Rect
+            The area of the surface that was drawn over
         """
-        Artist.draw_cannon(
+        return Artist.draw_cannon(
             surface, self.x, self.y, self.angle, self.pow, self.color
         )
 
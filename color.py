@@ -1,4 +1,4 @@
-from random import randint
+from random import randint, randrange
 
 class Color:
     """A class containing (R, G, B) tuple definitions for a variety of colors."""
@@ -11,7 +11,14 @@ class Color:
     LIGHT_BLUE = (50, 100, 230)
     GRAY = (128, 128, 128)
 
+    # Random colors made once when the module is loaded, by choosing three 
+    # RGB values from 5-255, so that objects can just pick one
+    PALETTE = [
+        (randint(5, 255), randint(5, 255), randint(5, 255)) 
+        for _ in range(256)
+    ]
+
     @staticmethod
     def rand_color() -> tuple:
-        """Returns a random color by choosing three RGB values from 5-255"""
-        return (randint(5, 255), randint(5, 255), randint(5, 255))
\ No newline at end of file
+        """Returns a random color from the palette"""
+        return Color.PALETTE[randrange(len(Color.PALETTE))]
\ No newline at end of file
@@ -0,0 +1,137 @@
+import numpy as np
+
+# Numba is optional. Without it, the kernels fall back to NumPy expressions
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def step_targets(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        vxs: np.ndarray,
+        vys: np.ndarray,
+        sizes: np.ndarray,
+        x_max: np.ndarray,
+        y_max: np.ndarray,
+        moving: np.ndarray) -> None:
+    """
+    Moves every moving target based on its velocity and rebounds it off the 
+    screen's edges, in place
+
+    Static targets are left exactly where they are, even if they were placed
+    closer to an edge than their size
+
+    Parameters
+    ----------
+    xs : np.ndarray
+        The x coordinates of the targets
+    ys : np.ndarray
+        The y coordinates of the targets
+    vxs : np.ndarray
+        The x velocities of the targets
+    vys : np.ndarray
+        The y velocities of the targets
+    sizes : np.ndarray
+        The sizes of the targets
+    x_max : np.ndarray
+        The furthest each target can go before hitting the right edge
+    y_max : np.ndarray
+        The furthest each target can go before hitting the bottom edge
+    moving : np.ndarray
+        Whether or not each target is a moving target
+    """
+    # Static targets have a velocity of 0
+    xs += vxs
+    ys += vys
+
+    # Which moving targets hit an edge of the screen
+    hit_x = ((xs < sizes) | (xs > x_max)) & moving
+    hit_y = ((ys < sizes) | (ys > y_max)) & moving
+
+    # Make sure the moving targets don't go off-screen
+    np.clip(xs, sizes, x_max, out=xs, where=moving)
+    np.clip(ys, sizes, y_max, out=ys, where=moving)
+
+    # Reverse the velocity of the targets that hit an edge, by multiplying 
+    # every velocity by -1 (hit) or 1 (not hit) rather than indexing by mask
+    vxs *= 1 - 2 * hit_x.astype(vxs.dtype)
+    vys *= 1 - 2 * hit_y.astype(vys.dtype)
+
+def collide(
+        px: np.ndarray,
+        py: np.ndarray,
+        pr: np.ndarray,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        sizes: np.ndarray,
+        out_hits: np.ndarray) -> None:
+    """
+    Checks every projectile against every target, writing the results into
+    out_hits
+
+    Parameters
+    ----------
+    px : np.ndarray
+        The x coordinates of the projectiles
+    py : np.ndarray
+        The y coordinates of the projectiles
+    pr : np.ndarray
+        How far each projectile reaches (its size plus any collision buffer)
+    xs : np.ndarray
+        The x coordinates of the targets
+    ys : np.ndarray
+        The y coordinates of the targets
+    sizes : np.ndarray
+        The sizes of the targets
+    out_hits : np.ndarray
+        A (projectiles, targets) bool array to write whether each pair collided
+    """
+    # Squared distances between each projectile (rows) and target (columns)
+    d2 = (xs[None, :] - px[:, None])**2 + (ys[None, :] - py[:, None])**2
+
+    # The minimum acceptable non-collision distance
+    min_dist = sizes[None, :] + pr[:, None]
+
+    np.less_equal(d2, min_dist**2, out=out_hits)
+
+if njit:
+
+    @njit(cache=True, fastmath=True)
+    def step_targets(xs, ys, vxs, vys, sizes, x_max, y_max, moving):
+        """Compiled version of step_targets. Refer to the NumPy version above"""
+        for i in range(xs.shape[0]):
+            if not moving[i]:
+                continue
+
+            size = sizes[i]
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+
+            # Left or right edge
+            if xs[i] < size:
+                xs[i] = size
+                vxs[i] = -vxs[i]
+            elif xs[i] > x_max[i]:
+                xs[i] = x_max[i]
+                vxs[i] = -vxs[i]
+
+            # Top or bottom edge
+            if ys[i] < size:
+                ys[i] = size
+                vys[i] = -vys[i]
+            elif ys[i] > y_max[i]:
+                ys[i] = y_max[i]
+                vys[i] = -vys[i]
+
+    # Releases the GIL, so the main thread can keep going while a collision
+    # worker runs it
+    @njit(cache=True, fastmath=True, nogil=True)
+    def collide(px, py, pr, xs, ys, sizes, out_hits):
+        """Compiled version of collide. Refer to the NumPy version above"""
+        for p in range(px.shape[0]):
+            for t in range(xs.shape[0]):
+                d_x = xs[t] - px[p]
+                d_y = ys[t] - py[p]
+                min_dist = sizes[t] + pr[p]
+                out_hits[p, t] = d_x*d_x + d_y*d_y <= min_dist*min_dist
@@ -1,12 +1,14 @@
 from cannon import MovingCannon, ArtificialCannon
 from targets import TargetMaster
+from bombs import BombMaster
 from color import Color
 from artist import Artist
 
-import threading
 import pygame
-import time
+import numpy as np
 import random
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 
 class ScoreTable:
     """
@@ -31,7 +33,10 @@ class ScoreTable:
         The font we're using
     score: int
         The number of targets destroyed
-    
+    cached_state : tuple
+        Everything the score table showed when it was last rendered
+    cached_score : list[tuple]
+        The score table as it was last rendered (see Artist.render_score)
     """
     def __init__(
             self, 
@@ -43,6 +48,10 @@ class ScoreTable:
         self.targets_destroyed = targets_destroyed
         self.projectiles_used = projectiles_used
         self.font = pygame.font.SysFont(font_name, font_size)
+
+        # Nothing has been rendered yet
+        self.cached_state = None
+        self.cached_score = None
     
     @property
     def score(self) -> int:
@@ -53,9 +62,13 @@ class ScoreTable:
             self, 
             surface: pygame.Surface, 
             chosen_type: str = None, 
-            health : int = None) -> None:
+            health : int = None) -> list[pygame.Rect]:
         """
-        Draws the score table by delegating to the Artist draw_score method
+        Draws the score table by delegating to the Artist render_score and
+        draw_rendered methods
+
+        Rendering text is slow, so the table is only re-rendered when
+        something it shows changed. Otherwise, the last render is drawn again
 
         Parameters
         ----------
@@ -65,18 +78,35 @@ class ScoreTable:
             The currently chosen projectile type
         health : int
             The user's health
+
+        Returns
+        -------
+        rects : list[pygame.Rect]
+            The areas of the surface that were drawn over
         """
-        Artist.draw_score(
-            surface, 
-            self.font, 
+        state = (
+            surface.get_size(),
             self.targets_destroyed, 
             self.projectiles_used, 
-            self.score,
             chosen_type,
-            health,
-            Color.RED, 
-            Color.WHITE
-            )
+            health
+        )
+
+        if state != self.cached_state:
+            self.cached_state = state
+            self.cached_score = Artist.render_score(
+                surface.get_size(), 
+                self.font, 
+                self.targets_destroyed, 
+                self.projectiles_used, 
+                self.score,
+                chosen_type,
+                health,
+                Color.RED, 
+                Color.WHITE
+                )
+
+        return Artist.draw_rendered(surface, self.cached_score)
     
     def draw_game_over_screen(
                         self,
@@ -125,8 +155,23 @@ class Manager:
         A list of the artificial enemy cannons
     target_master : TargetMaster
         The controller of all the targets on the screen
-    bomb_spawning_thread : threading.Thread
-        A thread that handles periodic bomb spawning for all targets
+    move_table : tuple
+        The (key, user cannon move function) pairs for moving the user cannon
+    type_table : tuple
+        The (key, projectile type) pairs for switching the user's projectile
+    bomb_master : BombMaster
+        The controller of all the bombs dropped by the targets
+    bomb_queue : list[Target]
+        The targets (in a random order) still to drop a bomb this round
+    next_bomb_time : int
+        The time (in Pygame ticks) at which the next bomb drop is due
+    drawn_rects : list[pygame.Rect]
+        The areas of the screen drawn over on the last tick
+    dirty_rects : list[pygame.Rect]
+        The areas of the screen that changed on the last tick
+    collision_executor : ThreadPoolExecutor
+        The single worker thread that finds target collisions while the main
+        thread handles the bombs and the user collisions
     """
     def __init__(
             self, 
@@ -140,11 +185,20 @@ class Manager:
 
         self.num_cannons = num_cannons
         self.init_cannons()
+        self.init_controls()
 
         self.score_t = ScoreTable()
         self.num_targets = num_targets
-        self.bomb_spawning_thread = None
-        self.start_bomb_thread()
+        self.bomb_master = BombMaster()
+        self.bomb_queue = []
+        self.next_bomb_time = pygame.time.get_ticks() + 500
+
+        self.drawn_rects: list[pygame.Rect] = []
+        self.dirty_rects: list[pygame.Rect] = []
+
+        # A single worker kept for the whole game, rather than a new thread 
+        # every tick
+        self.collision_executor = ThreadPoolExecutor(max_workers=1)
         
         self.update_display()
 
@@ -153,12 +207,43 @@ class Manager:
         pygame.display.init()
         pygame.font.init()
 
-        self.screen = pygame.display.set_mode(self.screen_size)
+        # SCALED (with double buffering) lets SDL draw the screen through its 
+        # hardware accelerated renderer, where the platform supports it. With
+        # a renderer, display.update() always presents the whole screen, so 
+        # only the partial fills of handle_drawing still save any work
+        flags = pygame.SCALED | pygame.DOUBLEBUF
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                self.screen = pygame.display.set_mode(
+                    self.screen_size, flags, vsync=1
+                )
+            except pygame.error:
+                # Not every platform can enable vsync
+                self.screen = pygame.display.set_mode(self.screen_size, flags)
+
+        # Without a fast renderer, SCALED only costs us the partial display
+        # updates, so use a plain window instead
+        if any("no fast renderer" in str(w.message) for w in caught):
+            self.screen = pygame.display.set_mode(self.screen_size)
         pygame.display.set_caption("The Gun of Khiryanov II")
 
-    def update_display(self) -> None:
-        """Updates the Pygame screen by calling display.flip()"""
-        pygame.display.flip()
+    def update_display(self, rects: list[pygame.Rect] = None) -> None:
+        """
+        Updates the Pygame screen
+
+        Only the given areas are updated (with display.update()) if they're
+        provided, otherwise the whole screen is (with display.flip())
+
+        Parameters
+        ----------
+        rects : list[pygame.Rect]
+            The areas of the screen to update (default None)
+        """
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
 
     def init_clock(self) -> None:
         """Initializes the Pygame clock and refresh rate"""
@@ -188,6 +273,33 @@ class Manager:
 
         self.target_master = TargetMaster()
 
+    def init_controls(self) -> None:
+        """
+        Initializes which keys control the user cannon
+
+        These are built once (for the user cannon created by init_cannons) 
+        rather than on every tick
+        """
+        # Which key corresponds to what movement
+        self.move_table = (
+            (pygame.K_LEFT, self.user_cannon.move_left),
+            (pygame.K_RIGHT, self.user_cannon.move_right),
+            (pygame.K_UP, self.user_cannon.move_up),
+            (pygame.K_DOWN, self.user_cannon.move_down),
+            
+            (pygame.K_a, self.user_cannon.move_left),
+            (pygame.K_d, self.user_cannon.move_right),
+            (pygame.K_w, self.user_cannon.move_up),
+            (pygame.K_s, self.user_cannon.move_down)
+        )
+
+        # Which key corresponds to what type of projectile
+        self.type_table = (
+            (pygame.K_1, 's'),
+            (pygame.K_2, 'c'),
+            (pygame.K_3, 't')
+        )
+
     def process_states(self) -> None:
         """Processes the entire game - an aspect of the main game loop"""
         # Handle any inputs by the player
@@ -200,10 +312,16 @@ class Manager:
         self.handle_cannon_movement() # cannon 
         self.handle_target_movement() # targets
         self.handle_projectile_movement() # projectiles
+
+        # Start finding the target collisions in the background, now that
+        # the targets and projectiles are where they'll be checked at
+        target_collisions = self.submit_target_collisions()
+
+        self.handle_bomb_spawning() # bombs
         self.handle_bomb_movement() # bombs
         
         # Handle collisions
-        self.handle_collisions()
+        self.handle_collisions(target_collisions)
 
         # Handle dead objects
         self.handle_exploded_bombs() # bombs
@@ -214,7 +332,7 @@ class Manager:
 
         # Draw everything to the screen
         self.handle_drawing()
-        self.update_display()
+        self.update_display(self.dirty_rects)
     
     def handle_angles(self) -> None:
         """
@@ -236,34 +354,14 @@ class Manager:
     def handle_cannon_movement(self) -> None:
         """Handle artificial and user cannon movement and type switching"""
         
-        # Which key corresponds to what movement
-        key_to_move = {
-            pygame.K_LEFT: self.user_cannon.move_left,
-            pygame.K_RIGHT: self.user_cannon.move_right,
-            pygame.K_UP: self.user_cannon.move_up,
-            pygame.K_DOWN: self.user_cannon.move_down,
-            
-            pygame.K_a: self.user_cannon.move_left,
-            pygame.K_d: self.user_cannon.move_right,
-            pygame.K_w: self.user_cannon.move_up,
-            pygame.K_s: self.user_cannon.move_down
-        }
-
-        # Which key corresponds to what type of projectile
-        type_switcher = {
-            pygame.K_1: 's',
-            pygame.K_2: 'c',
-            pygame.K_3: 't'
-        }
-
         # Move depending on the move key
         keys_pressed = pygame.key.get_pressed()
-        for key, move_func in key_to_move.items():
+        for key, move_func in self.move_table:
             if keys_pressed[key]:
                 move_func(self.screen_size)
         
         # Switch depending on the switch key
-        for key, chosen_type in type_switcher.items():
+        for key, chosen_type in self.type_table:
             if keys_pressed[key]:
                 self.user_cannon.change_chosen(chosen_type)
         
@@ -304,105 +402,325 @@ class Manager:
         for artificial_cannon in self.artificial_cannons:
             artificial_cannon.projectile_master.remove_dead()
 
+    def handle_bomb_spawning(
+            self, 
+            delay: int = 500, 
+            stagger: int = 100, 
+            chance: float = 0.8) -> None:
+        """
+        Spawn bombs depending on the delay, stagger, and chance
+
+        Bombs are dropped in rounds: every target (in a random order) gets
+        a chance to drop a bomb, one target every stagger milliseconds, and
+        there's a delay between the rounds. This is checked against the Pygame
+        clock once per tick rather than by sleeping in a thread, taking every
+        turn that came due since the last tick
+        
+        Parameters
+        ----------
+        delay : int
+            The delay (in milliseconds) to wait between rounds of bomb 
+            dropping (default 500)
+        stagger : int
+            The delay (in milliseconds) to wait between each target dropping 
+            their bombs. This is to prevent all the bombs from getting dropped 
+            at the same time (default 100)
+        chance : float
+            The decimal chance of a target dropping a bomb on its turn
+        """
+        now = pygame.time.get_ticks()
+
+        # If the game stalled, carry on from now rather than dropping every
+        # bomb that was missed in the meantime
+        if now - self.next_bomb_time > delay:
+            self.next_bomb_time = now
+
+        # A tick can be longer than the stagger, so take every turn that came
+        # due since the last tick
+        while self.next_bomb_time <= now:
+            # Start a new round, randomizing which target we're dropping bombs
+            # from
+            if not self.bomb_queue:
+                self.bomb_queue = random.sample(
+                    self.target_master.target_list,
+                    len(self.target_master.target_list)
+                )
+
+            if self.bomb_queue:
+                target = self.bomb_queue.pop()
+
+                # Targets destroyed since the round started don't get their 
+                # turn
+                if target.is_alive:
+                    # Create a bomb with the given chance
+                    self.bomb_master.create_bomb(
+                        target.x, target.y + target.size, 1, chance
+                    )
+
+            # Stagger bomb drops so they don't all come out at the same time,
+            # and wait for the delay once every target had its turn. This is
+            # counted from when the turn was due, not from this tick, so the 
+            # waits don't get rounded up to the next tick
+            self.next_bomb_time += stagger if self.bomb_queue else delay
+
     def handle_bomb_movement(self) -> None:
         """Handles the movement of all the bombs"""
-        for target in self.target_master.target_list:
-            target.bomb_master.move_all()
+        self.bomb_master.move_all()
 
     def handle_exploded_bombs(self) -> None:
         """Removes dead bombs from the screen"""
-        for target in self.target_master.target_list:
-            target.bomb_master.remove_exploded(
-                                                self.screen_size[1], 
-                                                self.user_cannon
-                                            )
-
-    def handle_collisions(self) -> None:
-        """Handles target and user collisions by delagating to the respective function"""
-        self.handle_target_collisions()
+        self.bomb_master.remove_exploded(self.screen_size[1], self.user_cannon)
+
+    def handle_collisions(self, target_collisions: Future) -> None:
+        """
+        Handles target and user collisions by delagating to the respective 
+        function
+
+        The user collisions don't involve the targets or the user's 
+        projectiles, so they're handled while the target collisions are still
+        being found
+
+        Parameters
+        ----------
+        target_collisions : concurrent.futures.Future
+            The target collisions being found, from submit_target_collisions
+        """
         self.handle_user_collision()
+        self.handle_target_collisions(target_collisions.result())
         self.handle_artificial_collision()
+
+    def submit_target_collisions(self) -> Future:
+        """
+        Starts finding the target collisions on the collision worker
+
+        The projectile positions are copied into an array here, on the main 
+        thread. The target arrays are used as they are, since nothing changes 
+        them until the result is handled by handle_target_collisions. If there
+        are no projectiles or no targets, an already finished (empty) result 
+        is returned instead
+
+        Returns
+        -------
+        target_collisions : concurrent.futures.Future
+            The (projectile index, target index) pairs that collided, once
+            they've been found. Refer to `find_target_collisions`
+        """
+        projectile_list = self.user_cannon.projectile_master.projectile_list
+
+        # Nothing can collide, so don't bother the worker
+        if not projectile_list or not self.target_master.target_list:
+            target_collisions = Future()
+            target_collisions.set_result([])
+            return target_collisions
+
+        # Gather the projectile positions and sizes once per tick
+        projectiles = np.array(
+            [(p.x, p.y, p.size) for p in projectile_list], 
+            dtype=np.float32
+        ).reshape(-1, 3)
+
+        return self.collision_executor.submit(
+            self.find_target_collisions, projectiles
+        )
+
+    def find_target_collisions(self, projectiles: np.ndarray) -> list:
+        """
+        Finds which of the user's projectiles collided with which targets
+
+        Every projectile is checked against every target at once through the
+        target master's arrays. Once there are more targets than the target
+        master's quadtree_threshold, the targets are put into a quadtree 
+        (kept between ticks while the targets don't move much) instead, so 
+        each projectile is only checked against the targets near it
+
+        Parameters
+        ----------
+        projectiles : np.ndarray
+            The (projectiles, 3) array of the x, y, and size of each of the 
+            user's projectiles
+
+        Returns
+        -------
+        pairs : list
+            The (projectile index, target index) pairs that collided, ordered 
+            by projectile, then target
+        """
+        if len(self.target_master.target_list) <= self.target_master.quadtree_threshold:
+            hits = self.target_master.check_collisions(
+                projectiles[:, 0], projectiles[:, 1], projectiles[:, 2]
+            )
+            return np.argwhere(hits).tolist()
+
+        tree = self.target_master.get_quadtree(self.screen_size)
+
+        xs = self.target_master.xs.tolist()
+        ys = self.target_master.ys.tolist()
+        sizes = self.target_master.sizes.tolist()
+        
+        pairs = []
+        candidate_count = 0
+        for p_i, (p_x, p_y, p_size) in enumerate(projectiles.tolist()):
+            # The reach includes the check_collision buffer
+            reach = p_size + 10
+
+            candidates = tree.query((
+                p_x - reach, p_y - reach,
+                p_x + reach, p_y + reach
+            ))
+            candidate_count += len(candidates)
+
+            # Same check as Drawable.check_collision, on squared distances
+            for t_i in sorted(candidates):
+                d_x = xs[t_i] - p_x
+                d_y = ys[t_i] - p_y
+                min_dist = sizes[t_i] + reach
+
+                if d_x*d_x + d_y*d_y <= min_dist*min_dist:
+                    pairs.append((p_i, t_i))
+
+        self.target_master.record_candidates(candidate_count, len(projectiles))
+
+        return pairs
     
-    def handle_target_collisions(self) -> None:
+    def handle_target_collisions(self, pairs: list) -> None:
         """
-        Handles target collisions by checking if any projectile collided
-        with any target. The objects must agree on shape type
+        Handles target collisions given which projectiles collided with which
+        targets. The objects must agree on shape type, and a projectile
+        is used up by the first target it destroys
+
+        Parameters
+        ----------
+        pairs : list
+            The (projectile index, target index) pairs that collided, ordered
+            by projectile, then target. Refer to `find_target_collisions`
         """
-        for projectile in self.user_cannon.projectile_master.projectile_list:
-            for target in self.target_master.target_list:
-                
-                if target.check_collision(projectile):
-                    
-                    if target.shape == projectile.shape:
-                        self.target_master.target_list.remove(target)
-                        self.score_t.targets_destroyed += 1
-                
+        if not pairs:
+            return
+
+        target_list = self.target_master.target_list
+        projectile_list = self.user_cannon.projectile_master.projectile_list
+
+        # Indices of the targets destroyed and projectiles spent this tick
+        destroyed: set[int] = set()
+        spent: set[int] = set()
+
+        # The pairs are ordered by projectile, then target, so each projectile
+        # destroys the first target of its shape it hit and nothing else
+        for p_i, t_i in pairs:
+            if p_i in spent or t_i in destroyed:
+                continue
+
+            target = target_list[t_i]
+            projectile = projectile_list[p_i]
+            if target.shape == projectile.shape:
+                destroyed.add(t_i)
+                spent.add(p_i)
+                self.score_t.targets_destroyed += 1
+
+                # The dead projectile is cleaned up by handle_dead_projectiles
+                target.kill()
+                projectile.kill()
+
+        self.target_master.remove_targets(destroyed)
+
     def handle_user_collision(self) -> None:
         """
         Handles user collisions by checking if any artificial projectile
         collided with the user
+
+        Projectiles that hit are killed (rather than removed from the list 
+        while it's being looped over), and cleaned up by 
+        handle_dead_projectiles
         """
         for artificial_cannon in self.artificial_cannons:
             for projectile in artificial_cannon.projectile_master.projectile_list:
+                if not projectile.is_alive:
+                    continue
+
                 if self.user_cannon.check_collision(projectile):
                     self.user_cannon.deal()
-                    artificial_cannon.projectile_master.projectile_list.remove(projectile)
+                    projectile.kill()
     
     def handle_artificial_collision(self) -> None:
         """
         Handles artificial cannon collisions by checking if any user
         projectiles collided with the artificial cannon
+
+        Projectiles that hit are killed (rather than removed from the list 
+        while it's being looped over), and cleaned up by 
+        handle_dead_projectiles
         """
-        for artificial_cannon in self.artificial_cannons:
+        if not self.user_cannon.projectile_master.projectile_list:
+            return
+
+        # Loop over a copy, since destroyed cannons are removed from the list
+        for artificial_cannon in self.artificial_cannons[:]:
             for projectile in self.user_cannon.projectile_master.projectile_list:
+                if not projectile.is_alive:
+                    continue
                 
                 if artificial_cannon.check_collision(projectile):
                     # If a projectile hits an enemy cannon, don't count it
                     self.score_t.projectiles_used -= 1
                     artificial_cannon.deal()
+                    projectile.kill()
                     
                     if not artificial_cannon.is_alive:
                         # ac counts as 5 targets
                         self.score_t.targets_destroyed += 5
-                        self.artificial_cannons.remove(artificial_cannon)    
-                    
-                    self.user_cannon.projectile_master.projectile_list.remove(projectile)
-
+                        self.artificial_cannons.remove(artificial_cannon)
+                        break
 
     def handle_drawing(self) -> None:
-        """Handles drawing all the objects"""
-        # Fills the background color
-        self.screen.fill(Color.BLACK)
-        self.draw_projectiles()
-        self.draw_targets()
-        self.draw_cannons()
-        self.draw_bombs()
-        self.draw_score()
-
-    def draw_projectiles(self) -> None:
-        """Draws every projectile"""
-        self.user_cannon.projectile_master.draw_all(self.screen)
+        """
+        Handles drawing all the objects
+
+        Rather than filling the whole screen, only the areas drawn over last
+        tick are cleared. The areas cleared and drawn over this tick are kept
+        in dirty_rects, so only those need to be updated on the display
+        """
+        # Fills the background color over last tick's drawings
+        for rect in self.drawn_rects:
+            self.screen.fill(Color.BLACK, rect)
+
+        drawn_rects = []
+        drawn_rects += self.draw_projectiles()
+        drawn_rects += self.draw_targets()
+        drawn_rects += self.draw_cannons()
+        drawn_rects += self.draw_bombs()
+        drawn_rects += self.draw_score()
+
+        # Both the cleared and the newly drawn areas changed on the screen
+        self.dirty_rects = self.drawn_rects + drawn_rects
+        self.drawn_rects = drawn_rects
+
+    def draw_projectiles(self) -> list[pygame.Rect]:
+        """Draws every projectile and returns the areas drawn over"""
+        rects = self.user_cannon.projectile_master.draw_all(self.screen)
         for artificial_cannon in self.artificial_cannons:
-            artificial_cannon.projectile_master.draw_all(self.screen)
+            rects += artificial_cannon.projectile_master.draw_all(self.screen)
+        
+        return rects
 
-    def draw_targets(self) -> None:
-        """Draws every target""" 
-        self.target_master.draw_all(self.screen)
+    def draw_targets(self) -> list[pygame.Rect]:
+        """Draws every target and returns the areas drawn over""" 
+        return self.target_master.draw_all(self.screen)
 
-    def draw_cannons(self) -> None:
-        """Draws every cannon"""
-        self.user_cannon.draw(self.screen)
+    def draw_cannons(self) -> list[pygame.Rect]:
+        """Draws every cannon and returns the areas drawn over"""
+        rects = [self.user_cannon.draw(self.screen)]
         for artificial_cannon in self.artificial_cannons:
-            artificial_cannon.draw(self.screen)
+            rects.append(artificial_cannon.draw(self.screen))
+        
+        return rects
 
-    def draw_bombs(self) -> None:
-        """Draws every bomb"""
-        for target in self.target_master.target_list:
-            target.bomb_master.draw_all(self.screen)
+    def draw_bombs(self) -> list[pygame.Rect]:
+        """Draws every bomb and returns the areas drawn over"""
+        return self.bomb_master.draw_all(self.screen)
 
-    def draw_score(self) -> None:
-        """Draws the score table"""
-        self.score_t.draw(
+    def draw_score(self) -> list[pygame.Rect]:
+        """Draws the score table and returns the areas drawn over"""
+        return self.score_t.draw(
                         self.screen, 
                         self.user_cannon.chosen_type, 
                         self.user_cannon.health
@@ -435,60 +753,12 @@ class Manager:
 
     def create_mission(self) -> None:
         """Creates a num_targets amount of random targets"""
-        for _ in range(self.num_targets):
-            self.target_master.create_random_target(
-                self.screen_size,
-                self.target_master.calculate_target_size(self.score_t.score),
-            )
-    
-    def start_bomb_thread(self) -> None:
-        """Starts the bomb_spawning_thread"""
-        if not self.bomb_spawning_thread:
-            self.bomb_spawning_thread = threading.Thread(
-                target=self.spawn_bombs, daemon=True
-                )
-            self.bomb_spawning_thread.start()
+        self.target_master.create_random_targets(
+            self.screen_size,
+            self.num_targets,
+            self.score_t.score
+        )
     
-    def spawn_bombs(self, delay = 0.5, stagger = 0.1, chance = 0.8):
-        """
-        Spawn bombs depending on the delay, stagger, and chance
-        
-        Parameters
-        ----------
-        delay : float
-            The delay to wait between bomb dropping checks (default 0.5)
-        stagger : float
-            The delay to wait between each target dropping their bombs
-            This is to prevent all the bombs from getting dropped at the
-            same time (default 0.1)
-        chance : float
-            The decimal chance of a target dropping a bomb on a given tick
-        """
-        # While the bomb_spawning_thread is active
-        while self.bomb_spawning_thread:
-
-            # Wait for the delay
-            time.sleep(delay)
-
-            # If it is still active
-            if self.bomb_spawning_thread:
-                # Randomize which target we're dropping bombs from
-                random.shuffle(self.target_master.target_list)
-                                
-                for target in self.target_master.target_list:
-                    # Stagger bomb drops so they don't all come out at the 
-                    # same time
-                    time.sleep(stagger)
-                    
-                    # Create a bomb with the given chance
-                    target.bomb_master.create_bomb(
-                        target.x, target.y + target.size, 1, chance
-                    )
-
-    def end_bomb_thread(self):
-        """Ends the bomb_spawning_thread by resetting it to None"""
-        self.bomb_spawning_thread = None
-
     def game_loop(self):
         """Keep playing until the user ends the game"""
         while not self.done:
@@ -517,6 +787,8 @@ class Manager:
 
     def game_over_loop(self) -> None:
         """Continuously the game over screen"""
+        # There are no more collisions to find
+        self.collision_executor.shutdown()
 
         show_game_over = True
         while show_game_over:
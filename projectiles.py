@@ -4,7 +4,7 @@ from artist import Artist
 
 import random
 from math import cos, sin
-from pygame import Surface
+from pygame import Surface, Rect
 
 class ProjectileMaster:
     """
@@ -82,7 +82,7 @@ class ProjectileMaster:
         created_projectile = chosen_type(**params)
         self.projectile_list.append(created_projectile)
 
-    def draw_all(self, surface: Surface) -> None:
+    def draw_all(self, surface: Surface) -> list[Rect]:
         """
         Simply loops through all the projectiles and draws them to the surface
         
@@ -92,8 +92,13 @@ class ProjectileMaster:
         ----------
         surface : pygame.Surface
             The surface to draw the projectiles to
+
+        Returns
+        -------
+        rects : list[pygame.Rect]
+            The areas of the surface that were drawn over
         """
-        [projectile.draw(surface) for projectile in self.projectile_list]
+        return [projectile.draw(surface) for projectile in self.projectile_list]
     
     def move_all(self, screen_size: tuple) -> None:
         """
@@ -107,16 +112,26 @@ class ProjectileMaster:
         screen_size : tuple
             The size of the screen
         """
-        [
-            projectile.move(screen_size, grav = 2) 
-            for projectile in self.projectile_list
-        ]
+        for projectile in self.projectile_list:
+            projectile.move(screen_size, grav = 2)
     
     def remove_dead(self) -> None:
-        """Removes dead projectiles from the projectile list"""
-        for projectile in self.projectile_list:
-            if not projectile.is_alive:
-                self.projectile_list.remove(projectile)
+        """
+        Removes dead projectiles from the projectile list
+        
+        Walks the list from the back, replacing each dead projectile with the
+        last one in the list, so nothing has to be shifted down (the order of
+        the projectiles isn't kept)
+        """
+        projectile_list = self.projectile_list
+
+        for i in range(len(projectile_list) - 1, -1, -1):
+            if not projectile_list[i].is_alive:
+                # Pop before filling the gap, so a projectile fired (by a
+                # strike thread) in the meantime is moved, not lost
+                last = projectile_list.pop()
+                if i < len(projectile_list):
+                    projectile_list[i] = last
 
 class Projectile(Drawable, Killable, Moveable):
     """A class representing a projectile
@@ -150,8 +165,15 @@ class Projectile(Drawable, Killable, Moveable):
     shape : str
         A string of characters 's', 't', or 'c' denoting whether the object is a
         square, triangle, or circle.
+    draw_fn : function
+        The Artist draw function for the object's shape, chosen once when the
+        object is created
     """
 
+    __slots__ = (
+        'x', 'y', 'color', 'size', 'health', 'v_x', 'v_y', 'shape', 'draw_fn'
+    )
+
     def __init__(
             self, 
             x: int, 
@@ -179,6 +201,7 @@ class Projectile(Drawable, Killable, Moveable):
         Moveable.__init__(self, v_x, v_y)
         # Shape initialization
         self.shape = shape
+        self.draw_fn = Artist.shape_drawer(shape)
 
     def move(
             self, 
@@ -212,20 +235,22 @@ class Projectile(Drawable, Killable, Moveable):
             if self.y > screen_size[1] - 2 * self.size:
              self.kill()
 
-    def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> Rect:
         """
-        Uses a static Artist draw function to draw the object to the given 
-        surface
+        Uses the Artist draw function for its shape to draw the object to the 
+        given surface
         
         Parameters
         ----------
         surface : pygame.Surface
             A surface object to draw the Drawable onto
+
+        Returns
+        -------
+        rect : pygame.Rect
+            The area of the surface that was drawn over
         """
-        Artist.draw(
-            surface, 
-            self.x, self.y, 
-            self.color, self.size, self.shape)
+        return self.draw_fn(surface, self.x, self.y, self.color, self.size)
     
     def check_corners(
             self, 
@@ -286,6 +311,8 @@ class Projectile(Drawable, Killable, Moveable):
 
 class CircleProjectile(Projectile):
     """A Projectile of shape Circle. Refer to `Projectile`"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
@@ -294,6 +321,8 @@ class CircleProjectile(Projectile):
 
 class SquareProjectile(Projectile):
     """A Projectile of shape Square. Refer to `Projectile`"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
@@ -302,6 +331,8 @@ class SquareProjectile(Projectile):
         
 class TriangleProjectile(Projectile):
     """A Projectile of shape Triangle. Refer to `Projectile`"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
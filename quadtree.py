@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+class Quadtree:
+    """
+    A class representing a region quadtree of axis-aligned bounding boxes
+
+    Used as a broad phase for collision checking: objects are inserted with
+    their bounding box, and a query only returns the objects whose boxes
+    overlap the queried box. Those candidates still need an exact collision
+    check.
+
+    A node holds up to `capacity` objects before splitting into four children.
+    Objects that don't fit entirely inside a single child (they straddle a
+    split line) stay in the node itself.
+
+    Attributes
+    ----------
+    bounds : tuple
+        A tuple representing the (x_min, y_min, x_max, y_max) region of the node
+    capacity : int
+        The number of objects a node holds before splitting (default 4)
+    max_depth : int
+        The maximum depth of the tree. Nodes at this depth never split
+        (default 5)
+    depth : int
+        The depth of this node (0 for the root)
+    items : list[tuple]
+        A list of the (aabb, obj) pairs stored in this node
+    children : list[Quadtree]
+        The four child nodes, or None if the node hasn't split
+    """
+
+    def __init__(
+            self,
+            bounds: tuple,
+            capacity: int = 4,
+            max_depth: int = 5,
+            depth: int = 0) -> None:
+        """Initializes an empty node covering the given bounds"""
+        self.bounds = bounds
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.depth = depth
+
+        self.items: list[tuple] = []
+        self.children: list[Quadtree] = None
+
+    def insert(self, aabb: tuple, obj: object) -> None:
+        """
+        Inserts an object into the tree
+
+        Parameters
+        ----------
+        aabb : tuple
+            A tuple representing the (x_min, y_min, x_max, y_max) bounding box
+            of the object
+        obj : object
+            The object to store. It is returned as-is by query
+        """
+        node = self
+
+        # Walk down to the deepest existing node that fully contains the box
+        while node.children:
+            child = node.child_containing(aabb)
+            if child is None:
+                break
+            node = child
+
+        node.items.append((aabb, obj))
+
+        # Split full leaves (unless we're already as deep as we're allowed)
+        if (node.children is None
+                and len(node.items) > node.capacity
+                and node.depth < node.max_depth):
+            node.split()
+
+    def query(self, aabb: tuple) -> list:
+        """
+        Finds every object whose bounding box overlaps the given box
+
+        Parameters
+        ----------
+        aabb : tuple
+            A tuple representing the (x_min, y_min, x_max, y_max) box to query
+
+        Returns
+        -------
+        found : list
+            A list of the objects overlapping the box
+        """
+        x_min, y_min, x_max, y_max = aabb
+        found = []
+
+        # Iterative traversal to avoid a Python call per visited node
+        stack = [self]
+        while stack:
+            node = stack.pop()
+
+            for (o_x_min, o_y_min, o_x_max, o_y_max), obj in node.items:
+                if (o_x_min <= x_max and x_min <= o_x_max
+                        and o_y_min <= y_max and y_min <= o_y_max):
+                    found.append(obj)
+
+            if node.children:
+                for child in node.children:
+                    c_x_min, c_y_min, c_x_max, c_y_max = child.bounds
+                    if (c_x_min <= x_max and x_min <= c_x_max
+                            and c_y_min <= y_max and y_min <= c_y_max):
+                        stack.append(child)
+
+        return found
+
+    def child_containing(self, aabb: tuple) -> Quadtree:
+        """
+        Finds the child node that fully contains the given box
+
+        Parameters
+        ----------
+        aabb : tuple
+            A tuple representing the (x_min, y_min, x_max, y_max) box
+
+        Returns
+        -------
+        child : Quadtree
+            The child containing the box, or None if the box straddles the
+            node's split lines (or if the node hasn't split)
+        """
+        if not self.children:
+            return None
+
+        x_min, y_min, x_max, y_max = aabb
+        mid_x = (self.bounds[0] + self.bounds[2]) / 2
+        mid_y = (self.bounds[1] + self.bounds[3]) / 2
+
+        # Which side of the split lines the box is on (None if it's on both)
+        if x_max < mid_x:
+            col = 0
+        elif x_min >= mid_x:
+            col = 1
+        else:
+            return None
+
+        if y_max < mid_y:
+            row = 0
+        elif y_min >= mid_y:
+            row = 1
+        else:
+            return None
+
+        return self.children[2*row + col]
+
+    def split(self) -> None:
+        """Splits the node into four children and pushes its items down"""
+        x_min, y_min, x_max, y_max = self.bounds
+        mid_x = (x_min + x_max) / 2
+        mid_y = (y_min + y_max) / 2
+
+        # Children are ordered top-left, top-right, bottom-left, bottom-right
+        self.children = [
+            Quadtree(bounds, self.capacity, self.max_depth, self.depth + 1)
+            for bounds in (
+                (x_min, y_min, mid_x, mid_y),
+                (mid_x, y_min, x_max, mid_y),
+                (x_min, mid_y, mid_x, y_max),
+                (mid_x, mid_y, x_max, y_max),
+            )
+        ]
+
+        # Re-insert the items into the children that fully contain them
+        items, self.items = self.items, []
+        for aabb, obj in items:
+            child = self.child_containing(aabb)
+            if child is None:
+                self.items.append((aabb, obj))
+            else:
+                child.items.append((aabb, obj))
+
+        # A child may itself be over capacity now
+        for child in self.children:
+            if len(child.items) > child.capacity and child.depth < child.max_depth:
+                child.split()
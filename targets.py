@@ -1,9 +1,13 @@
+from __future__ import annotations
+
 from abstract import Drawable, Killable, Moveable
 from color import Color
 from artist import Artist
-from bombs import BombMaster
+from quadtree import Quadtree
+from kernels import step_targets, collide
 
-from pygame import Surface
+from pygame import Surface, Rect
+import numpy as np
 import random
 
 class TargetMaster:
@@ -12,21 +16,81 @@ class TargetMaster:
 
     Introduces methods for creating random targets and maintaining existing 
     targets (drawing them and moving them)
+
+    Alongside the target list, the positions, sizes, and velocities of the
+    targets are kept in NumPy arrays (one entry per target, in the same order
+    as target_list), so that moving and collision checking can be done for
+    every target at once. Static targets have a velocity of 0.
     
     Attributes
     ----------
     target_list : list[Target]
         A list of all the targets created by this TargetMaster
+    moving_list : list[MovingTarget]
+        A list of the moving targets in target_list (in the same order)
+    moving_mask : np.ndarray
+        Whether or not each target is a moving target
+    xs : np.ndarray
+        The x coordinates of the targets
+    ys : np.ndarray
+        The y coordinates of the targets
+    sizes : np.ndarray
+        The sizes of the targets
+    vxs : np.ndarray
+        The x velocities of the targets
+    vys : np.ndarray
+        The y velocities of the targets
+    bounds_size : tuple
+        The screen size x_max and y_max were worked out for, or None if they
+        need to be worked out again
+    x_max : np.ndarray
+        The furthest each target can go before hitting the right edge
+    y_max : np.ndarray
+        The furthest each target can go before hitting the bottom edge
     moving_target_type : list
         A list of the moveable types of targets
     static_target_type : list
         A list of the static types of targets
+    rng : np.random.Generator
+        The random generator used to create whole batches of targets at once
+    quadtree_threshold : int
+        The number of targets above which collisions are checked through a
+        quadtree instead of by brute force (default 256)
+    quadtree_margin : int
+        How far the targets can move before the quadtree has to be rebuilt
+        (default 32)
+    quadtree : Quadtree
+        The last quadtree built by get_quadtree, or None if it needs to be
+        rebuilt
+    quadtree_positions : np.ndarray
+        The (2, targets) positions of the targets when the quadtree was built
+    candidate_average : float
+        The recent average number of candidates the quadtree returned per 
+        query
     """
 
     def __init__(self) -> None:
         """Initializes the empty target list"""
         self.target_list: list[Target] = []
 
+        # The moving targets picked out when they're added, so we don't need
+        # to check every target's type on every tick
+        self.moving_list: list[MovingTarget] = []
+        self.moving_mask = np.empty(0, dtype=np.bool_)
+
+        # The target attributes used by the vectorized movement and collisions
+        self.xs = np.empty(0, dtype=np.float32)
+        self.ys = np.empty(0, dtype=np.float32)
+        self.sizes = np.empty(0, dtype=np.float32)
+        self.vxs = np.empty(0, dtype=np.float32)
+        self.vys = np.empty(0, dtype=np.float32)
+
+        # The screen's edges for each target, which only change when the
+        # targets or the screen size do
+        self.bounds_size = None
+        self.x_max = np.empty(0, dtype=np.float32)
+        self.y_max = np.empty(0, dtype=np.float32)
+
         # The types of targets available
         self.moving_target_type = [
             MovingSquare, 
@@ -39,6 +103,19 @@ class TargetMaster:
             StaticCircle
         ]
 
+        self.rng = np.random.default_rng()
+
+        # The vectorized brute force is cheaper than building a tree until
+        # there are a lot of targets
+        self.quadtree_threshold = 256
+
+        # The quadtree is kept between ticks for as long as the targets stay
+        # close to where they were when it was built
+        self.quadtree_margin = 32
+        self.quadtree = None
+        self.quadtree_positions = None
+        self.candidate_average = None
+
     def create_random_target(
             self, 
             screen_size: tuple, 
@@ -90,7 +167,160 @@ class TargetMaster:
         
         # Create and store the target
         created_target = chosen_type(**params)
-        self.target_list.append(created_target)
+        self.add_target(created_target)
+
+    def create_random_targets(
+            self, 
+            screen_size: tuple, 
+            number: int, 
+            score: int) -> None:
+        """
+        Creates a number of random targets at once
+
+        Does the same as calling create_random_target (with a size from 
+        calculate_target_size) for each target, but draws all the random
+        values for the whole batch from the NumPy generator in one go
+        The generated targets are added to the target list, not returned
+
+        Parameters
+        ----------
+        screen_size : tuple
+            A tuple representing the (X, Y) size of the screen
+        number : int
+            The number of targets to create
+        score : int
+            The score to calculate the target sizes based off of
+        """
+        sizes = self.calculate_target_sizes(score, number)
+
+        # Positions so the targets fit on the screen
+        xs = self.rng.integers(sizes, screen_size[0] - sizes, endpoint=True)
+        ys = self.rng.integers(sizes, screen_size[1] - sizes, endpoint=True)
+
+        # Velocities (only used by the moving targets)
+        v_xs = self.rng.integers(-2, 2, number, endpoint=True)
+        v_ys = self.rng.integers(-2, 2, number, endpoint=True)
+
+        # Which type of target to create. There are as many moving types as
+        # static ones, so this is the same 50% chance of a moving target
+        target_types = self.moving_target_type + self.static_target_type
+        kinds = self.rng.integers(0, len(target_types), number)
+
+        # Colors from the palette
+        colors = self.rng.integers(0, len(Color.PALETTE), number)
+
+        created_targets = []
+        for size, x, y, v_x, v_y, kind, color in zip(
+                sizes.tolist(), 
+                xs.tolist(), ys.tolist(), 
+                v_xs.tolist(), v_ys.tolist(), 
+                kinds.tolist(),
+                colors.tolist()):
+            color = Color.PALETTE[color]
+            
+            if kind < len(self.moving_target_type):
+                created_targets.append(target_types[kind](
+                    x=x, y=y, v_x=v_x, v_y=v_y, color=color, size=size
+                ))
+            else:
+                created_targets.append(target_types[kind](
+                    x=x, y=y, color=color, size=size
+                ))
+
+        self.add_targets(created_targets)
+
+    def add_target(self, target: Target) -> None:
+        """
+        Stores a target in the target list (and the moving list, if moving)
+        and the target arrays. Refer to `add_targets`
+
+        Parameters
+        ----------
+        target : Target
+            The target to add
+        """
+        self.add_targets([target])
+
+    def add_targets(self, targets: list) -> None:
+        """
+        Stores targets in the target list (and the moving list, if moving)
+        and the target arrays
+
+        Parameters
+        ----------
+        targets : list[Target]
+            The targets to add
+        """
+        self.target_list.extend(targets)
+
+        # Static targets don't move, so their velocity is 0
+        is_moving = []
+        v_xs, v_ys = [], []
+        for target in targets:
+            if isinstance(target, MovingTarget):
+                self.moving_list.append(target)
+                is_moving.append(True)
+                v_xs.append(target.v_x)
+                v_ys.append(target.v_y)
+            else:
+                is_moving.append(False)
+                v_xs.append(0)
+                v_ys.append(0)
+
+        self.quadtree = None
+        self.bounds_size = None
+        self.moving_mask = np.concatenate((
+            self.moving_mask, np.array(is_moving, dtype=np.bool_)
+        ))
+        self.xs = np.concatenate((
+            self.xs, np.array([t.x for t in targets], dtype=np.float32)
+        ))
+        self.ys = np.concatenate((
+            self.ys, np.array([t.y for t in targets], dtype=np.float32)
+        ))
+        self.sizes = np.concatenate((
+            self.sizes, np.array([t.size for t in targets], dtype=np.float32)
+        ))
+        self.vxs = np.concatenate((self.vxs, np.array(v_xs, dtype=np.float32)))
+        self.vys = np.concatenate((self.vys, np.array(v_ys, dtype=np.float32)))
+
+    def remove_targets(self, indices: set) -> None:
+        """
+        Removes the targets at the given indices from the target lists and the
+        target arrays
+
+        Parameters
+        ----------
+        indices : set[int]
+            The indices (in target_list) of the targets to remove
+        """
+        if not indices:
+            return
+
+        # Rebuild the list in a single pass rather than deleting one by one
+        # (kept as the same list object, for anything holding on to it)
+        self.target_list[:] = [
+            target 
+            for i, target in enumerate(self.target_list) 
+            if i not in indices
+        ]
+
+        indices = list(indices)
+        self.quadtree = None
+        self.bounds_size = None
+        self.moving_mask = np.delete(self.moving_mask, indices)
+        self.xs = np.delete(self.xs, indices)
+        self.ys = np.delete(self.ys, indices)
+        self.sizes = np.delete(self.sizes, indices)
+        self.vxs = np.delete(self.vxs, indices)
+        self.vys = np.delete(self.vys, indices)
+
+        # Pick out the remaining moving targets again
+        self.moving_list[:] = [
+            target 
+            for target, is_moving in zip(self.target_list, self.moving_mask) 
+            if is_moving
+        ]
 
     def calculate_target_size(self, score: int) -> int:
         """
@@ -116,7 +346,157 @@ class TargetMaster:
 
         return int(random.uniform(10, min(30, 30 + weight * 20)))
 
-    def draw_all(self, surface: Surface) -> None:
+    def calculate_target_sizes(self, score: int, number: int) -> np.ndarray:
+        """
+        Determines a number of target sizes at once based on the score
+
+        Refer to `calculate_target_size`
+
+        Parameters 
+        ----------
+        score : int
+            The score to calculate the target sizes based off of
+        number : int
+            The number of sizes to calculate
+        
+        Returns
+        -------
+        sizes : np.ndarray
+            The sizes of the targets calculated
+        """
+        score = max(0, score)
+
+        weight = 1/(score + 1)
+
+        return self.rng.uniform(10, min(30, 30 + weight * 20), number).astype(int)
+
+    def build_quadtree(self, screen_size: tuple, margin: int = 0) -> Quadtree:
+        """
+        Builds a quadtree over the bounding boxes of all the targets
+
+        The objects stored in the tree are the targets' indices in the target
+        list, so the tree is only valid until the target list changes
+
+        Parameters
+        ----------
+        screen_size : tuple
+            A tuple representing the (X, Y) size of the screen
+        margin : int
+            How much to grow each bounding box by on every side, so the tree 
+            still covers targets that moved less than that since (default 0)
+
+        Returns
+        -------
+        tree : Quadtree
+            The quadtree containing every target
+        """
+        tree = Quadtree((0, 0, screen_size[0], screen_size[1]))
+
+        for i, (x, y, size) in enumerate(zip(
+                self.xs.tolist(), self.ys.tolist(), self.sizes.tolist())):
+            reach = size + margin
+            tree.insert((x - reach, y - reach, x + reach, y + reach), i)
+
+        return tree
+
+    def get_quadtree(self, screen_size: tuple) -> Quadtree:
+        """
+        Returns a quadtree over all the targets, reusing the last one if the
+        targets haven't moved much since it was built
+
+        The tree's boxes are grown by quadtree_margin on every side, so it 
+        stays valid until a target moves further than that from where it was
+        when the tree was built. The tree is rebuilt once that happens, if 
+        targets were added or removed, or if record_candidates found the tree
+        had gone stale
+
+        Parameters
+        ----------
+        screen_size : tuple
+            A tuple representing the (X, Y) size of the screen
+
+        Returns
+        -------
+        tree : Quadtree
+            The quadtree containing every target
+        """
+        positions = np.stack((self.xs, self.ys))
+
+        if (self.quadtree is None 
+                or np.abs(positions - self.quadtree_positions).max(initial=0) 
+                    > self.quadtree_margin):
+            self.quadtree = self.build_quadtree(screen_size, self.quadtree_margin)
+            self.quadtree_positions = positions
+
+        return self.quadtree
+
+    def record_candidates(self, count: int, queries: int) -> None:
+        """
+        Keeps track of how many candidates the quadtree returned this tick
+        
+        A reused tree returns more candidates than a fresh one, so if this
+        tick's candidates per query are over twice the recent average, the 
+        tree is marked to be rebuilt on the next tick. The count is divided by
+        the number of queries so that more projectiles in flight don't look 
+        like a stale tree
+
+        Parameters
+        ----------
+        count : int
+            The number of candidates the quadtree returned this tick
+        queries : int
+            The number of queries (projectiles) the candidates came from
+        """
+        # Nothing was looked up, so there's nothing to learn from this tick
+        if not queries:
+            return
+
+        per_query = count / queries
+
+        if self.candidate_average is None:
+            self.candidate_average = per_query
+            return
+
+        if per_query > 2 * max(self.candidate_average, 1):
+            self.quadtree = None
+
+        # Exponential moving average over the recent ticks
+        self.candidate_average = 0.9 * self.candidate_average + 0.1 * per_query
+
+    def check_collisions(
+            self,
+            px: np.ndarray,
+            py: np.ndarray,
+            psizes: np.ndarray) -> np.ndarray:
+        """
+        Checks every projectile against every target at once
+
+        Uses the same distance check as Drawable.check_collision (including
+        its buffer), but for all the (projectile, target) pairs in one go by
+        delegating to the collide kernel
+
+        Parameters
+        ----------
+        px : np.ndarray
+            The x coordinates of the projectiles
+        py : np.ndarray
+            The y coordinates of the projectiles
+        psizes : np.ndarray
+            The sizes of the projectiles
+
+        Returns
+        -------
+        hits : np.ndarray
+            A (projectiles, targets) bool array denoting which pairs collided
+        """
+        hits = np.empty((len(px), len(self.xs)), dtype=np.bool_)
+
+        # The projectiles' reach includes a small buffer
+        collide(px, py, psizes + 10, self.xs, self.ys, self.sizes, hits)
+
+        return hits
+
+    def draw_all(self, surface: Surface) -> list[Rect]:
         """
         Simply loops through all the targets and draws them to the surface
         
@@ -126,26 +506,63 @@ class TargetMaster:
         ----------
         surface : pygame.Surface
             The surface to draw the target to
+
+        Returns
+        -------
+        rects : list[pygame.Rect]
+            The areas of the surface that were drawn over
         """
-        [target.draw(surface) for target in self.target_list]
+        return [target.draw(surface) for target in self.target_list]
     
+    def update_bounds(self, screen_size: tuple) -> None:
+        """
+        Works out how far each target can go before hitting the right or 
+        bottom edge of the screen, if the targets or the screen size changed
+        since it was last worked out
+
+        Parameters
+        ----------
+        screen_size : tuple
+            The size of the screen
+        """
+        if self.bounds_size == screen_size:
+            return
+
+        self.bounds_size = screen_size
+        self.x_max = screen_size[0] - self.sizes
+        self.y_max = screen_size[1] - self.sizes
+
     def move_all(self, screen_size: tuple) -> None:
         """
-        Simply loops through all the targets and moves them based on their velocity
+        Moves all the targets based on their velocity
         
-        Simply calls the target.move function on each target if it's a moving
-        target
+        Moves the targets (rebounding them off the screen's edges) on the 
+        target arrays by delegating to the step_targets kernel, then copies 
+        the new positions and velocities back onto the moving targets
 
         Parameters
         ----------
         screen_size : tuple
             The size of the screen
         """
-        [
-            target.move(screen_size) 
-            for target in self.target_list 
-            if isinstance(target, MovingTarget)
-        ]
+        self.update_bounds(screen_size)
+
+        step_targets(
+            self.xs, self.ys, 
+            self.vxs, self.vys, 
+            self.sizes, 
+            self.x_max, self.y_max,
+            self.moving_mask
+        )
+
+        # Only the moving targets' values can have changed
+        moving = self.moving_mask
+        for target, x, y, v_x, v_y in zip(
+                self.moving_list,
+                self.xs[moving].tolist(), self.ys[moving].tolist(),
+                self.vxs[moving].tolist(), self.vys[moving].tolist()):
+            target.x, target.y = x, y
+            target.v_x, target.v_y = v_x, v_y
 
 class Target(Drawable, Killable):
     """
@@ -178,10 +595,13 @@ class Target(Drawable, Killable):
     shape : str
         A string of characters 's', 't', or 'c' denoting whether the object is a
         square, triangle, or circle.
-    bomb_master : BombMaster
-        The controller of all bombs created by this target
+    draw_fn : function
+        The Artist draw function for the object's shape, chosen once when the
+        object is created
     """
 
+    __slots__ = ('x', 'y', 'color', 'size', 'health', 'shape', 'draw_fn')
+
     def __init__(
             self, 
             x: int, 
@@ -206,22 +626,24 @@ class Target(Drawable, Killable):
         Killable.__init__(self, health=health)
         # Shape initialization
         self.shape = shape
-
-        self.bomb_master = BombMaster()
+        self.draw_fn = Artist.shape_drawer(shape)
     
-    def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> Rect:
         """
-        Uses a static Artist draw function to draw the object to the given surface
+        Uses the Artist draw function for its shape to draw the object to the 
+        given surface
         
         Parameters
         ----------
         surface : pygame.Surface
             A surface object to draw the Drawable onto
+
+        Returns
+        -------
+        rect : pygame.Rect
+            The area of the surface that was drawn over
         """
-        Artist.draw(
-            surface, 
-            self.x, self.y, 
-            self.color, self.size, self.shape)
+        return self.draw_fn(surface, self.x, self.y, self.color, self.size)
 
     def __str__(self) -> str:
         """Returns a string representation of the object"""
@@ -247,7 +669,9 @@ class MovingTarget(Moveable, Target):
     for the shape. In addition, this type of target can be moved around the screen
     (making it a Moveable as well).
 
-    MovingTarget simply inherits from the abstract Moveable and the concrete Target
+    MovingTarget simply inherits from the abstract Moveable and the concrete Target.
+    Moving targets are moved by their TargetMaster (see TargetMaster.move_all),
+    which keeps their positions and velocities in its arrays
         
     Attributes
     ----------
@@ -274,6 +698,9 @@ class MovingTarget(Moveable, Target):
         square, triangle, or circle.
     """
 
+    # Only the attributes that Target doesn't already have
+    __slots__ = ('v_x', 'v_y')
+
     def __init__(
             self, 
             x: int, 
@@ -294,79 +721,13 @@ class MovingTarget(Moveable, Target):
         This is due to behavior in Python with passing attributes through super
         functions.
         """
-        v_x = v_x or random.randint(-2, 2)
-        v_y = v_y or random.randint(-2, 2)
-        color = color or Color.rand_color()
+        v_x = v_x if v_x is not None else random.randint(-2, 2)
+        v_y = v_y if v_y is not None else random.randint(-2, 2)
 
         # Parent class initialization
         Moveable.__init__(self, v_x, v_y)
         Target.__init__(self, x, y, color, size, health, shape)
     
-    def move(self, screen_size: tuple) -> None:
-        """
-        Changes the x and y position of the object depending on the velocities
-        and delgates to checking if we hit the edge of the screen
-
-        Parameters
-        ----------
-        screen_size : tuple
-            A tuple representing the (X, Y) size of the screen
-        """
-        self.x += self.v_x
-        self.y += self.v_y
-
-        self.check_corners(screen_size)
-    
-    def check_corners(self, screen_size: tuple) -> None:
-        """
-        Implements rebound when the target hits the screen's edge
-
-        Parameters
-        ----------
-        screen_size : tuple
-            A tuple representing the (X, Y) size of the screen
-        """
-
-        # If the target hits the left edge of the screen
-        if self.x < self.size:
-            # Make sure we don't go off-screen
-            self.x = self.size 
-
-            # Reverse the x velocity and calculate the new velocities (decreased)
-            # based on the reflection parameters
-            self.v_x = -int(self.v_x)
-            self.v_y = int(self.v_y)
-
-        # If the target hits the right edge of the scrteen
-        elif self.x > screen_size[0] - self.size:
-            # Make sure we don't go off-screen
-            self.x = screen_size[0] - self.size
-
-            # Reverse the x velocity and calculate the new velocities (decreased)
-            # based on the reflection parameters
-            self.v_x = -int(self.v_x)
-            self.v_y = int(self.v_y)
-
-        # If the target hits the top of the screen
-        if self.y < self.size:
-            # Make sure we don't go off-screen
-            self.y = self.size
-
-            # Reverse the y velocity and calculate the new velocities (decreased)
-            # based on the reflection parameters
-            self.v_x = int(self.v_x)
-            self.v_y = -int(self.v_y)
-        
-        # If the target hits the bottom of the screen
-        elif self.y > screen_size[1] - self.size:
-            # Make sure we don't go off-screen
-            self.y = screen_size[1] - self.size
-
-            # Reverse the y velocity and calculate the new velocities (decreased)
-            # based on the reflection parameters
-            self.v_x = int(self.v_x)
-            self.v_y = -int(self.v_y)
-    
     def __str__(self):
         """Returns a string representation of the object"""
 
@@ -381,6 +742,8 @@ class MovingTarget(Moveable, Target):
 
 class MovingSquare(MovingTarget):
     """A MovingTarget of shape Square. Refer to `MovingTarget`"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
@@ -389,6 +752,8 @@ class MovingSquare(MovingTarget):
 
 class MovingTriangle(MovingTarget):
     """A MovingTarget of shape Triangle. Refer to `MovingTarget`"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
@@ -397,6 +762,8 @@ class MovingTriangle(MovingTarget):
 
 class MovingCircle(MovingTarget):
     """A MovingTarget of shape Circle. Refer to `MovingTarget`"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
@@ -405,6 +772,8 @@ class MovingCircle(MovingTarget):
 
 class StaticSquare(Target):
     """A StaticTarget of shape Square. Refer to `Target`"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
@@ -413,6 +782,8 @@ class StaticSquare(Target):
 
 class StaticTriangle(Target):
     """A StaticTarget of shape Triangle. Refer to `Target`"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
@@ -421,6 +792,8 @@ class StaticTriangle(Target):
 
 class StaticCircle(Target):
     """A StaticTarget of shape Circle. Refer to `Target`"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
@@ -1,10 +1,16 @@
 import unittest
+import numpy as np
 from cannon import Cannon, MovingCannon, ArtificialCannon
 from color import Color
 from projectiles import ProjectileMaster
+from bombs import BombMaster
 from artist import Artist
 from abstract import Moveable, Drawable, Killable
-from targets import TargetMaster
+from targets import TargetMaster, StaticSquare, StaticCircle, MovingCircle
+from manager import Manager
+from types import SimpleNamespace
+from unittest import mock
+from quadtree import Quadtree
 
 
 class TestCannon(unittest.TestCase):
@@ -12,7 +18,7 @@ class TestCannon(unittest.TestCase):
     def setUp(self):
         self.test_cannon = Cannon(x = 100, y = 100, color = Color.RED)
         self.projectile_master = ProjectileMaster()
-        self.test_moving_cannon = Moveable(v_x = 7, v_y = 7)
+        self.test_moving_cannon = MovingCannon(x = 100, y = 100, v_x = 7, v_y = 7)
 
     def test_init(self):
         self.test_cannon = Cannon(x = 100, y = 100, color = Color.RED)
@@ -155,6 +161,197 @@ class TestProjectiles(unittest.TestCase):
    # def test_create_projectile(self):
     #    self.test_projectile = 
 
+    def test_remove_dead(self):
+        self.test_projectile = ProjectileMaster()
+        for i in range(6):
+            self.test_projectile.create_projectile(100 * i, 100, 0, 0, 'c')
+        projectile_list = list(self.test_projectile.projectile_list)
+        # Adjacent dead projectiles, including the last one
+        for i in [1, 2, 4, 5]:
+            projectile_list[i].kill()
+        self.test_projectile.remove_dead()
+        self.assertCountEqual(
+            self.test_projectile.projectile_list, 
+            [projectile_list[0], projectile_list[3]])
+
+class TestBombMaster(unittest.TestCase):
+    def test_remove_exploded(self):
+        self.test_bomb_master = BombMaster()
+        for i in range(6):
+            self.test_bomb_master.create_bomb(100 * i, 0, 0)
+        bomb_list = list(self.test_bomb_master.bomb_list)
+        # Adjacent dead bombs, including the last one
+        for i in [1, 2, 4, 5]:
+            bomb_list[i].kill()
+        # A user far away from every bomb
+        user = Cannon(x = 700, y = 500, color = Color.RED)
+        self.test_bomb_master.remove_exploded(600, user)
+        self.assertCountEqual(
+            self.test_bomb_master.bomb_list, [bomb_list[0], bomb_list[3]])
+
+class TestTargetMaster(unittest.TestCase):
+    def setUp(self):
+        self.test_target_master = TargetMaster()
+        self.test_target_master.add_target(StaticSquare(x = 100, y = 100, size = 20))
+        self.test_target_master.add_target(
+            MovingCircle(x = 790, y = 300, v_x = 2, v_y = -1, size = 20))
+
+    def test_arrays(self):
+        self.assertEqual(self.test_target_master.xs.tolist(), [100, 790])
+        self.assertEqual(self.test_target_master.vxs.tolist(), [0, 2])
+        self.assertEqual(len(self.test_target_master.moving_list), 1)
+        self.test_target_master.remove_targets({0})
+        self.assertEqual(len(self.test_target_master.target_list), 1)
+        self.assertEqual(self.test_target_master.moving_list, 
+                         self.test_target_master.target_list)
+        self.assertEqual(self.test_target_master.xs.tolist(), [790])
+        self.assertEqual(self.test_target_master.sizes.tolist(), [20])
+
+    def test_create_random_targets(self):
+        self.test_target_master.create_random_targets((800, 600), 10, 0)
+        self.assertEqual(len(self.test_target_master.target_list), 12)
+        self.assertEqual(len(self.test_target_master.xs), 12)
+        for target in self.test_target_master.target_list[2:]:
+            self.assertTrue(target.size <= target.x <= 800 - target.size)
+            self.assertTrue(target.size <= target.y <= 600 - target.size)
+            self.assertIn(target.color, Color.PALETTE)
+
+    def test_zero_velocity(self):
+        moving_target = MovingCircle(x = 100, y = 100, v_x = 0, v_y = 0)
+        self.assertEqual(moving_target.v_x, 0)
+        self.assertEqual(moving_target.v_y, 0)
+
+    def test_move_all(self):
+        # A static target closer to the edge than its size isn't moved
+        edge_target = StaticSquare(x = 400, y = 5, size = 20)
+        self.test_target_master.add_target(edge_target)
+        self.test_target_master.move_all((800, 600))
+        self.assertEqual(edge_target.y, 5)
+        self.assertEqual(self.test_target_master.ys.tolist()[-1], 5)
+        moving_target = self.test_target_master.target_list[1]
+        self.assertEqual(moving_target.x, 780)
+        self.assertEqual(moving_target.y, 299)
+        self.assertEqual(moving_target.v_x, -2)
+        self.assertEqual(self.test_target_master.target_list[0].x, 100)
+
+    def test_check_collisions(self):
+        hits = self.test_target_master.check_collisions(
+            np.array([110, 400]), np.array([100, 400]), np.array([5, 5]))
+        self.assertEqual(hits.tolist(), [[True, False], [False, False]])
+
+    def test_quadtree_reuse(self):
+        tree = self.test_target_master.get_quadtree((800, 600))
+        # Still within quadtree_margin of where the tree was built
+        self.test_target_master.xs += 5
+        self.assertIs(self.test_target_master.get_quadtree((800, 600)), tree)
+        # Past it
+        self.test_target_master.xs += 40
+        self.assertIsNot(self.test_target_master.get_quadtree((800, 600)), tree)
+
+    def test_record_candidates(self):
+        tree = self.test_target_master.get_quadtree((800, 600))
+        self.test_target_master.record_candidates(10, 5)
+        # More projectiles, but the same candidates per projectile
+        self.test_target_master.record_candidates(40, 20)
+        self.assertIs(self.test_target_master.quadtree, tree)
+        # A spike in candidates per projectile
+        self.test_target_master.record_candidates(50, 5)
+        self.assertIsNone(self.test_target_master.quadtree)
+        self.assertIsNot(self.test_target_master.get_quadtree((800, 600)), tree)
+
+class TestTargetCollisions(unittest.TestCase):
+    def setUp(self):
+        # Only the parts of the Manager that handle_target_collisions uses, 
+        # so no screen needs to be opened
+        self.test_manager = SimpleNamespace(
+            target_master = TargetMaster(),
+            user_cannon = Cannon(x = 100, y = 100, color = Color.RED),
+            score_t = SimpleNamespace(targets_destroyed = 0)
+        )
+        self.test_manager.target_master.add_targets([
+            StaticSquare(x = 100, y = 100),
+            StaticCircle(x = 200, y = 100),
+            StaticCircle(x = 300, y = 100)
+        ])
+        projectile_master = self.test_manager.user_cannon.projectile_master
+        for chosen_type in ['c', 's', 's']:
+            projectile_master.create_projectile(0, 0, 0, 0, chosen_type)
+
+    def test_handle_target_collisions(self):
+        target_list = list(self.test_manager.target_master.target_list)
+        projectile_list = \
+            self.test_manager.user_cannon.projectile_master.projectile_list
+        Manager.handle_target_collisions(self.test_manager, [
+            (0, 0), # wrong shape, so the circle goes on to the next target
+            (0, 1), 
+            (0, 2), # the circle was used up by target 1
+            (1, 0), 
+            (2, 0)  # target 0 was already destroyed
+        ])
+        self.assertEqual(self.test_manager.score_t.targets_destroyed, 2)
+        self.assertEqual(
+            self.test_manager.target_master.target_list, [target_list[2]])
+        self.assertEqual(
+            [projectile.is_alive for projectile in projectile_list], 
+            [False, False, True])
+
+class TestBombSpawning(unittest.TestCase):
+    def test_handle_bomb_spawning(self):
+        # Only the parts of the Manager that handle_bomb_spawning uses
+        test_manager = SimpleNamespace(
+            target_master = TargetMaster(),
+            bomb_master = BombMaster(),
+            bomb_queue = [],
+            next_bomb_time = 0
+        )
+        test_manager.target_master.add_targets([
+            StaticSquare(x = 100 * i, y = 100) for i in range(1, 4)
+        ])
+
+        # Ticks every 67 milliseconds (a refresh rate of 15) for 2 seconds
+        # Turns are due at 0, 100, 200, 700, 800, 900, 1400, 1500, and 1600
+        for now in range(0, 2001, 67):
+            with mock.patch("pygame.time.get_ticks", return_value = now):
+                Manager.handle_bomb_spawning(test_manager, chance = 1)
+        self.assertEqual(len(test_manager.bomb_master.bomb_list), 9)
+        self.assertEqual(test_manager.next_bomb_time, 2100)
+
+    def test_handle_bomb_spawning_stall(self):
+        test_manager = SimpleNamespace(
+            target_master = TargetMaster(),
+            bomb_master = BombMaster(),
+            bomb_queue = [],
+            next_bomb_time = 0
+        )
+        test_manager.target_master.add_target(StaticSquare(x = 100, y = 100))
+
+        # After a 10 second stall, only one turn is taken
+        with mock.patch("pygame.time.get_ticks", return_value = 10000):
+            Manager.handle_bomb_spawning(test_manager, chance = 1)
+        self.assertEqual(len(test_manager.bomb_master.bomb_list), 1)
+        self.assertEqual(test_manager.next_bomb_time, 10500)
+
+class TestQuadtree(unittest.TestCase):
+    def setUp(self):
+        self.test_tree = Quadtree((0, 0, 800, 600), capacity = 2)
+
+    def test_query(self):
+        self.test_tree.insert((10, 10, 20, 20), 'a')
+        self.test_tree.insert((700, 500, 720, 520), 'b')
+        self.test_tree.insert((390, 290, 410, 310), 'c')
+        self.assertEqual(self.test_tree.query((0, 0, 30, 30)), ['a'])
+        self.assertEqual(self.test_tree.query((715, 515, 800, 600)), ['b'])
+        self.assertEqual(self.test_tree.query((100, 100, 200, 200)), [])
+        self.assertEqual(
+            sorted(self.test_tree.query((0, 0, 800, 600))), ['a', 'b', 'c'])
+
+    def test_split(self):
+        self.assertIsNone(self.test_tree.children)
+        for i in range(3):
+            self.test_tree.insert((10 + i, 10, 20 + i, 20), i)
+        self.assertIsNotNone(self.test_tree.children)
+        self.assertEqual(sorted(self.test_tree.query((0, 0, 50, 50))), [0, 1, 2])
+
 
 
 